@@ -14,11 +14,39 @@
 
 """Create / interact with Google Cloud DNS connections."""
 
+import functools
+import http.client
+
+try:
+    import orjson
+except ImportError:  # pragma: NO COVER
+    import json
+
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+else:
+
+    def _json_dumps(value):
+        return orjson.dumps(value).decode("utf-8")
+
+    _json_loads = orjson.loads
+
+import google.auth.transport.requests
 from google.cloud import _http
 
 from google.cloud.dns import __version__
 
 
+_HTTPX_MAX_CONNECTIONS = 50
+"""Connection pool size for the optional ``httpx`` transport."""
+
+_CREDENTIALS_REFRESH_TIMEOUT = 300
+"""Seconds to wait for a credentials refresh, as for ``AuthorizedSession``."""
+
+_REFRESH_STATUS_CODES = (http.client.UNAUTHORIZED,)
+"""Response statuses after which credentials are refreshed and retried."""
+
+
 class Connection(_http.JSONConnection):
     """A connection to Google Cloud DNS via the JSON REST API.
 
@@ -42,3 +70,149 @@ class Connection(_http.JSONConnection):
 
     API_URL_TEMPLATE = "{api_base_url}/dns/{api_version}{path}"
     """A template for the URL of a particular API call."""
+
+    def api_request(
+        self,
+        method,
+        path,
+        query_params=None,
+        data=None,
+        content_type=None,
+        expect_json=True,
+        **kwargs
+    ):
+        """Make a request over the HTTP transport to the API.
+
+        Wraps :meth:`google.cloud._http.JSONConnection.api_request`, encoding
+        ``dict`` payloads and decoding JSON responses with ``orjson`` when it
+        is installed, falling back to the standard library ``json`` module.
+
+        :type method: str
+        :param method: The HTTP method name (ie, ``GET``, ``POST``, etc).
+
+        :type path: str
+        :param path: The path to the resource.
+
+        :type query_params: dict or list
+        :param query_params: (Optional) A dictionary of keys and values (or
+                             list of key-value pairs) to insert into the query
+                             string of the URL.
+
+        :type data: str or dict
+        :param data: (Optional) The data to send as the body of the request.
+                     A ``dict`` is sent as JSON.
+
+        :type content_type: str
+        :param content_type: (Optional) The proper MIME type of the data
+                             provided.
+
+        :type expect_json: bool
+        :param expect_json: (Optional) If True, parse the response as JSON.
+
+        :type kwargs: dict
+        :param kwargs: Additional arguments passed through to
+                       :meth:`google.cloud._http.JSONConnection.api_request`.
+
+        :rtype: dict or str
+        :returns: The API response payload, either as a raw string or
+                  a dictionary if the response is valid JSON.
+        """
+        if data and isinstance(data, dict):
+            data = _json_dumps(data)
+            content_type = "application/json"
+
+        content = super(Connection, self).api_request(
+            method,
+            path,
+            query_params=query_params,
+            data=data,
+            content_type=content_type,
+            expect_json=False,
+            **kwargs
+        )
+
+        if expect_json and content:
+            return _json_loads(content)
+        return content
+
+
+class _HTTPXSession(object):
+    """Adapt an HTTP/2 ``httpx.Client`` to the ``requests.Session`` interface.
+
+    Lets :class:`Connection` multiplex concurrent requests over a single
+    TLS connection.  Requires the optional ``httpx[http2]`` dependency.
+
+    As with :class:`~google.auth.transport.requests.AuthorizedSession`, a
+    request answered with ``401 Unauthorized`` is retried once after
+    refreshing the credentials.  Mutual TLS client certificates are not
+    supported.
+
+    :type credentials: :class:`~google.auth.credentials.Credentials`
+    :param credentials: The OAuth2 Credentials used to authorize requests.
+
+    :type max_connections: int
+    :param max_connections: (Optional) maximum size of the connection pool.
+
+    :type refresh_timeout: float
+    :param refresh_timeout: (Optional) seconds to wait for the credentials
+                            to be refreshed.
+    """
+
+    def __init__(
+        self,
+        credentials,
+        max_connections=_HTTPX_MAX_CONNECTIONS,
+        refresh_timeout=_CREDENTIALS_REFRESH_TIMEOUT,
+    ):
+        import httpx
+
+        self.credentials = credentials
+        self._auth_request = functools.partial(
+            google.auth.transport.requests.Request(), timeout=refresh_timeout
+        )
+        self._client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+
+    def request(self, method, url, data=None, headers=None, timeout=None):
+        """Send an authorized request, as :meth:`requests.Session.request`.
+
+        :type method: str
+        :param method: The HTTP method name (ie, ``GET``, ``POST``, etc).
+
+        :type url: str
+        :param url: The URL to send the request to.
+
+        :type data: str
+        :param data: (Optional) The data to send as the body of the request.
+
+        :type headers: dict
+        :param headers: (Optional) HTTP headers to send with the request.
+
+        :type timeout: float
+        :param timeout: (Optional) seconds to wait for the server response.
+
+        :rtype: :class:`httpx.Response`
+        :returns: The HTTP response.
+        """
+        response = self._send(method, url, data, headers, timeout)
+        if response.status_code in _REFRESH_STATUS_CODES:
+            self.credentials.refresh(self._auth_request)
+            response = self._send(method, url, data, headers, timeout)
+        return response
+
+    def _send(self, method, url, data, headers, timeout):
+        """Apply the credentials' headers and send a single request."""
+        headers = dict(headers or {})
+        self.credentials.before_request(self._auth_request, method, url, headers)
+        return self._client.request(
+            method, url, content=data, headers=headers, timeout=timeout
+        )
+
+    def close(self):
+        """Close the underlying ``httpx`` client and its connections."""
+        self._client.close()
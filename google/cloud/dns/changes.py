@@ -74,6 +74,17 @@ class Changes(object):
         )
         self._properties = resource
 
+    @property
+    def _base_path(self):
+        """URL path for the zone's change set collection.
+
+        :rtype: str
+        :returns: the path based on project and zone names.
+        """
+        return "/".join(
+            ("/projects", self.zone.project, "managedZones", self.zone.name, "changes")
+        )
+
     @property
     def path(self):
         """URL path for change set APIs.
@@ -81,11 +92,7 @@ class Changes(object):
         :rtype: str
         :returns: the path based on project, zone, and change set names.
         """
-        return "/projects/%s/managedZones/%s/changes/%s" % (
-            self.zone.project,
-            self.zone.name,
-            self.name,
-        )
+        return f"{self._base_path}/{self.name}"
 
     @property
     def name(self):
@@ -226,12 +233,8 @@ class Changes(object):
         if len(self.additions) == 0 and len(self.deletions) == 0:
             raise ValueError("No record sets added or deleted")
         client = self._require_client(client)
-        path = "/projects/%s/managedZones/%s/changes" % (
-            self.zone.project,
-            self.zone.name,
-        )
         api_response = client._connection.api_request(
-            method="POST", path=path, data=self._build_resource()
+            method="POST", path=self._base_path, data=self._build_resource()
         )
         self._set_properties(api_response)
 
@@ -14,14 +14,25 @@
 
 """Client for interacting with the Google Cloud DNS API."""
 
+from concurrent import futures
+import copy
+import time
+
 from google.api_core import page_iterator
 from google.api_core import client_options as client_options_mod
 from google.cloud.client import ClientWithProject
 
 from google.cloud.dns._http import Connection
+from google.cloud.dns._http import _HTTPXSession
 from google.cloud.dns.zone import ManagedZone
 
 
+_FROM_API_REPR = ManagedZone.from_api_repr
+
+_QUOTA_CACHE_TTL = 60.0
+"""Default number of seconds for which :meth:`Client.quotas` are cached."""
+
+
 class Client(ClientWithProject):
     """Client to bundle configuration needed for API requests.
 
@@ -56,6 +67,14 @@ class Client(ClientWithProject):
         or :class:`dict`
     :param client_options: (Optional) Client options used to set user options
         on the client. API Endpoint should be set through client_options.
+
+    :type transport: str
+    :param transport: (Optional) HTTP transport used when no ``_http`` object
+        is passed: ``"requests"`` (the default) or ``"httpx"``, which
+        multiplexes concurrent requests over HTTP/2 and requires the
+        ``httpx`` extra.  The ``httpx`` transport refreshes credentials and
+        retries once on ``401 Unauthorized``, but does not support mutual
+        TLS client certificates.
     """
 
     SCOPE = ("https://www.googleapis.com/auth/ndev.clouddns.readwrite",)
@@ -68,48 +87,99 @@ class Client(ClientWithProject):
         _http=None,
         client_info=None,
         client_options=None,
+        transport=None,
     ):
+        if transport not in (None, "requests", "httpx"):
+            raise ValueError("transport must be 'requests' or 'httpx'")
+
         super(Client, self).__init__(
             project=project, credentials=credentials, _http=_http
         )
-
-        kwargs = {"client_info": client_info}
-        if client_options:
+        if transport == "httpx" and _http is None:
+            self._http_internal = _HTTPXSession(self._credentials)
+        self._quota_cache = None
+        self._quota_cache_project = None
+        self._quota_cache_ts = 0.0
+
+        api_endpoint = None
+        if client_options is not None:
             if isinstance(client_options, dict):
                 client_options = client_options_mod.from_dict(client_options)
+            api_endpoint = client_options.api_endpoint
 
-            if client_options.api_endpoint:
-                kwargs["api_endpoint"] = client_options.api_endpoint
-
+        kwargs = {"client_info": client_info}
+        if api_endpoint:
+            kwargs["api_endpoint"] = api_endpoint
         self._connection = Connection(self, **kwargs)
 
-    def quotas(self):
+    @property
+    def _project_path(self):
+        """URL path for the project associated with this client.
+
+        :rtype: str
+        :returns: the path based on the current project.
+        """
+        return f"/projects/{self.project}"
+
+    @property
+    def _zones_path(self):
+        """URL path for the project's managed zones.
+
+        :rtype: str
+        :returns: the path based on the current project.
+        """
+        return f"/projects/{self.project}/managedZones"
+
+    def quotas(self, force_refresh=False, ttl=_QUOTA_CACHE_TTL):
         """Return DNS quotas for the project associated with this client.
 
         See
         https://cloud.google.com/dns/api/v1/projects/get
 
+        :type force_refresh: bool
+        :param force_refresh: (Optional) If true, always fetch the quotas
+                              from the API, ignoring any cached value.
+
+        :type ttl: float
+        :param ttl: (Optional) maximum age, in seconds, of cached quotas
+                    which may be returned instead of calling the API.
+                    Defaults to 60 seconds.
+
         :rtype: mapping
         :returns: keys for the mapping correspond to those of the ``quota``
                   sub-mapping of the project resource. ``kind`` is stripped
                   from the results.
         """
-        path = "/projects/%s" % (self.project,)
-        resp = self._connection.api_request(method="GET", path=path)
-
-        quotas = resp["quota"]
-        # Remove the key "kind"
+        now = time.monotonic()
+        if (
+            not force_refresh
+            and self._quota_cache is not None
+            and self._quota_cache_project == self.project
+            and now - self._quota_cache_ts < ttl
+        ):
+            return copy.deepcopy(self._quota_cache)
+
+        resp = self._connection.api_request(method="GET", path=self._project_path)
+
+        # Remove the key "kind", without mutating the API response
         # https://cloud.google.com/dns/docs/reference/v1/projects#resource
-        quotas.pop("kind", None)
+        quotas = {key: value for key, value in resp["quota"].items() if key != "kind"}
         if "whitelistedKeySpecs" in quotas:
             # whitelistedKeySpecs is a list of dicts that represent keyspecs
             # Remove "kind" here as well
-            for key_spec in quotas["whitelistedKeySpecs"]:
-                key_spec.pop("kind", None)
-
-        return quotas
-
-    def list_zones(self, max_results=None, page_token=None):
+            quotas["whitelistedKeySpecs"] = [
+                {key: value for key, value in key_spec.items() if key != "kind"}
+                for key_spec in quotas["whitelistedKeySpecs"]
+            ]
+
+        self._quota_cache = quotas
+        self._quota_cache_project = self.project
+        self._quota_cache_ts = now
+        return copy.deepcopy(quotas)
+
+    def list_zones(
+        self, max_results=None, page_token=None, prefetch=False, page_size=None
+    ):
         """List zones for the project associated with this client.
 
         See
@@ -126,21 +196,69 @@ class Client(ClientWithProject):
             Deprecated: use the ``pages`` property of the returned iterator
             instead of manually passing the token.
 
+        :type prefetch: bool
+        :param prefetch: (Optional) If true, fetch the next page of zones in a
+                         background thread while the current page is being
+                         consumed.  If iteration stops before the last page,
+                         a request already in flight still runs to completion
+                         (up to the request timeout), and interpreter exit
+                         waits for it.
+
+        :type page_size: int
+        :param page_size: (Optional) maximum number of zones to request per
+                          page, bounding how many zones are held in memory
+                          at once.  If not passed, defaults to a value set
+                          by the API.  Requires ``google-api-core >= 1.31.0``.
+
         :rtype: :class:`~google.api_core.page_iterator.Iterator`
         :returns: Iterator of :class:`~google.cloud.dns.zone.ManagedZone`
                   belonging to this project.
         """
-        path = "/projects/%s/managedZones" % (self.project,)
-        return page_iterator.HTTPIterator(
+        if prefetch:
+            iterator_class = _PrefetchingHTTPIterator
+        else:
+            iterator_class = page_iterator.HTTPIterator
+        kwargs = {}
+        if page_size is not None:
+            # ``page_size`` is only accepted by google-api-core >= 1.31.0.
+            kwargs["page_size"] = page_size
+        return iterator_class(
             client=self,
             api_request=self._connection.api_request,
-            path=path,
+            path=self._zones_path,
             item_to_value=_item_to_zone,
             items_key="managedZones",
             page_token=page_token,
             max_results=max_results,
+            **kwargs,
         )
 
+    def iter_zones(self):
+        """Iterate over all zones for the project associated with this client.
+
+        A lightweight alternative to :meth:`list_zones` for callers which
+        consume every zone and do not need page-level access.
+
+        See
+        https://cloud.google.com/dns/api/v1/managedZones/list
+
+        :rtype: generator
+        :returns: Generator of :class:`~google.cloud.dns.zone.ManagedZone`
+                  belonging to this project.
+        """
+        query_params = {}
+        while True:
+            resp = self._connection.api_request(
+                method="GET", path=self._zones_path, query_params=query_params
+            )
+            for resource in resp.get("managedZones", ()):
+                yield _FROM_API_REPR(resource, self)
+
+            token = resp.get("nextPageToken")
+            if token is None:
+                return
+            query_params = {"pageToken": token}
+
     def zone(self, name, dns_name=None, description=None):
         """Construct a zone bound to this client.
 
@@ -160,7 +278,86 @@ class Client(ClientWithProject):
         :rtype: :class:`google.cloud.dns.zone.ManagedZone`
         :returns: a new ``ManagedZone`` instance.
         """
-        return ManagedZone(name, dns_name, client=self, description=description)
+        return ManagedZone(name, dns_name, self, description)
+
+
+class _PrefetchingHTTPIterator(page_iterator.HTTPIterator):
+    """HTTP iterator which requests page N+1 while page N is consumed.
+
+    The request for the following page is issued from a single background
+    worker as soon as a page is handed to the caller, overlapping the API
+    round-trip with the conversion of the current page's items.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(_PrefetchingHTTPIterator, self).__init__(*args, **kwargs)
+        self._executor = None
+        self._pending = None
+
+    def _next_page(self):
+        """Get the next page in the iterator.
+
+        :rtype: :class:`~google.api_core.page_iterator.Page` or ``NoneType``
+        :returns: The next page, or None if there are no pages left.
+        """
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            try:
+                response = pending.result()
+            except Exception:
+                # Release the worker; the error ends the page iteration.
+                self._shutdown()
+                raise
+        elif self._has_next_page():
+            response = self._get_next_page_response()
+        else:
+            self._shutdown()
+            return None
+
+        items = response.get(self._items_key, ())
+        page = page_iterator.Page(self, items, self.item_to_value, raw_page=response)
+        self._page_start(self, page, response)
+        self.next_page_token = response.get(self._next_token)
+        self._prefetch(page.num_items)
+        return page
+
+    def _prefetch(self, num_items):
+        """Submit the request for the page following the current one.
+
+        :type num_items: int
+        :param num_items: number of items in the page about to be returned,
+                          which are not yet counted in ``num_results``.
+        """
+        if self.next_page_token is None:
+            self._shutdown()
+            return
+
+        params = self._get_query_params()
+        if self.max_results is not None:
+            remaining = self.max_results - self.num_results - num_items
+            if remaining <= 0:
+                self._shutdown()
+                return
+            # Older google-api-core releases have no ``_page_size``.
+            page_size = getattr(self, "_page_size", None)
+            if page_size is not None:
+                remaining = min(remaining, page_size)
+            params[self._MAX_RESULTS] = remaining
+
+        if self._executor is None:
+            self._executor = futures.ThreadPoolExecutor(max_workers=1)
+        self._pending = self._executor.submit(
+            self.api_request,
+            method=self._HTTP_METHOD,
+            path=self.path,
+            query_params=params,
+        )
+
+    def _shutdown(self):
+        """Release the background worker, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
 
 
 def _item_to_zone(iterator, resource):
@@ -175,4 +372,4 @@ def _item_to_zone(iterator, resource):
     :rtype: :class:`.ManagedZone`
     :returns: The next managed zone in the page.
     """
-    return ManagedZone.from_api_repr(resource, iterator.client)
+    return _FROM_API_REPR(resource, iterator.client)
@@ -45,6 +45,8 @@ class ManagedZone(object):
         the value of 'dns_name'.
     """
 
+    __slots__ = ("name", "dns_name", "_client", "_properties", "__weakref__")
+
     def __init__(self, name, dns_name=None, client=None, description=None):
         self.name = name
         self.dns_name = dns_name
@@ -94,7 +96,7 @@ class ManagedZone(object):
         :rtype: str
         :returns: the path based on project and dataste name.
         """
-        return "/projects/%s/managedZones/%s" % (self.project, self.name)
+        return f"/projects/{self.project}/managedZones/{self.name}"
 
     @property
     def created(self):
@@ -255,7 +257,7 @@ class ManagedZone(object):
             ``client`` stored on the current zone.
         """
         client = self._require_client(client)
-        path = "/projects/%s/managedZones" % (self.project,)
+        path = f"/projects/{self.project}/managedZones"
         api_response = client._connection.api_request(
             method="POST", path=path, data=self._build_resource()
         )
@@ -342,7 +344,7 @@ class ManagedZone(object):
                   belonging to this zone.
         """
         client = self._require_client(client)
-        path = "/projects/%s/managedZones/%s/rrsets" % (self.project, self.name)
+        path = f"{self.path}/rrsets"
         iterator = page_iterator.HTTPIterator(
             client=client,
             api_request=client._connection.api_request,
@@ -382,7 +384,7 @@ class ManagedZone(object):
                   belonging to this zone.
         """
         client = self._require_client(client)
-        path = "/projects/%s/managedZones/%s/changes" % (self.project, self.name)
+        path = f"{self.path}/changes"
         iterator = page_iterator.HTTPIterator(
             client=client,
             api_request=client._connection.api_request,
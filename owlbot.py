@@ -27,6 +27,7 @@ common = gcp.CommonTemplates()
 # ----------------------------------------------------------------------------
 templated_files = common.py_library(
     microgenerator=True,
+    unit_test_extras=["orjson"],
 )
 s.move(templated_files, excludes=["docs/multiprocessing.rst", "README.rst"])
 
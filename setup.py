@@ -44,7 +44,10 @@ dependencies = [
     # https://github.com/googleapis/google-cloud-python/issues/10566
     "google-cloud-core >= 1.4.4, < 3.0dev",
 ]
-extras = {}
+extras = {
+    "httpx": ["httpx[http2] >= 0.23.0"],
+    "orjson": ["orjson >= 3.0.0"],
+}
 
 
 # Setup boilerplate below this line.
@@ -98,3 +98,144 @@ class TestConnection(unittest.TestCase):
             url=expected_uri,
             timeout=60,
         )
+
+    def test_api_request_w_json_data(self):
+        import json
+        import requests
+
+        http = mock.create_autospec(requests.Session, instance=True)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"id": "changeset_id", "additions": [{"ttl": "3600"}]}'
+        http.request.return_value = response
+        client = mock.Mock(_http=http, spec=["_http"])
+
+        conn = self._make_one(client)
+        req_data = {"additions": [{"name": "test.example.com", "ttl": "3600"}]}
+        result = conn.api_request("POST", "/rainbow", data=req_data)
+        self.assertEqual(result, {"id": "changeset_id", "additions": [{"ttl": "3600"}]})
+
+        call_kwargs = http.request.call_args[1]
+        self.assertEqual(json.loads(call_kwargs["data"]), req_data)
+        self.assertEqual(call_kwargs["headers"]["Content-Type"], "application/json")
+
+    def test_api_request_w_empty_response(self):
+        import requests
+
+        http = mock.create_autospec(requests.Session, instance=True)
+        response = requests.Response()
+        response.status_code = 204
+        response._content = b""
+        http.request.return_value = response
+        client = mock.Mock(_http=http, spec=["_http"])
+
+        conn = self._make_one(client)
+        result = conn.api_request("DELETE", "/rainbow")
+        self.assertEqual(result, b"")
+
+
+class Test_HTTPXSession(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.dns._http import _HTTPXSession
+
+        return _HTTPXSession
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def _make_httpx(self):
+        return mock.Mock(spec=["Client", "Limits"])
+
+    def test_ctor(self):
+        httpx = self._make_httpx()
+        credentials = mock.Mock(spec=["before_request"])
+
+        with mock.patch.dict("sys.modules", {"httpx": httpx}):
+            session = self._make_one(
+                credentials, max_connections=10, refresh_timeout=30
+            )
+
+        self.assertIs(session.credentials, credentials)
+        self.assertEqual(session._auth_request.keywords, {"timeout": 30})
+        self.assertIs(session._client, httpx.Client.return_value)
+        httpx.Limits.assert_called_once_with(
+            max_connections=10, max_keepalive_connections=10
+        )
+        httpx.Client.assert_called_once_with(
+            http2=True, limits=httpx.Limits.return_value
+        )
+
+    def test_request(self):
+        httpx = self._make_httpx()
+        credentials = mock.Mock(spec=["before_request"])
+
+        def _before_request(request, method, url, headers):
+            headers["authorization"] = "Bearer TOKEN"
+
+        credentials.before_request.side_effect = _before_request
+        httpx.Client.return_value.request.return_value.status_code = 200
+        with mock.patch.dict("sys.modules", {"httpx": httpx}):
+            session = self._make_one(credentials)
+
+        headers = {"User-Agent": "agent"}
+        response = session.request(
+            "POST", "https://example.com/path", data="{}", headers=headers, timeout=60
+        )
+
+        self.assertIs(response, httpx.Client.return_value.request.return_value)
+        self.assertEqual(headers, {"User-Agent": "agent"})
+        credentials.before_request.assert_called_once_with(
+            session._auth_request,
+            "POST",
+            "https://example.com/path",
+            {"User-Agent": "agent", "authorization": "Bearer TOKEN"},
+        )
+        httpx.Client.return_value.request.assert_called_once_with(
+            "POST",
+            "https://example.com/path",
+            content="{}",
+            headers={"User-Agent": "agent", "authorization": "Bearer TOKEN"},
+            timeout=60,
+        )
+
+    def test_request_w_unauthorized_refreshes_and_retries(self):
+        httpx = self._make_httpx()
+        credentials = mock.Mock(spec=["before_request", "refresh"])
+        unauthorized = mock.Mock(status_code=401)
+        ok = mock.Mock(status_code=200)
+        httpx.Client.return_value.request.side_effect = [unauthorized, ok]
+        with mock.patch.dict("sys.modules", {"httpx": httpx}):
+            session = self._make_one(credentials)
+
+        response = session.request("GET", "https://example.com/path")
+
+        self.assertIs(response, ok)
+        credentials.refresh.assert_called_once_with(session._auth_request)
+        self.assertEqual(credentials.before_request.call_count, 2)
+        self.assertEqual(httpx.Client.return_value.request.call_count, 2)
+
+    def test_request_w_unauthorized_retries_once(self):
+        httpx = self._make_httpx()
+        credentials = mock.Mock(spec=["before_request", "refresh"])
+        first = mock.Mock(status_code=401)
+        second = mock.Mock(status_code=401)
+        httpx.Client.return_value.request.side_effect = [first, second]
+        with mock.patch.dict("sys.modules", {"httpx": httpx}):
+            session = self._make_one(credentials)
+
+        response = session.request("GET", "https://example.com/path")
+
+        self.assertIs(response, second)
+        credentials.refresh.assert_called_once_with(session._auth_request)
+        self.assertEqual(httpx.Client.return_value.request.call_count, 2)
+
+    def test_close(self):
+        httpx = self._make_httpx()
+        credentials = mock.Mock(spec=["before_request"])
+        with mock.patch.dict("sys.modules", {"httpx": httpx}):
+            session = self._make_one(credentials)
+
+        session.close()
+
+        httpx.Client.return_value.close.assert_called_once_with()
@@ -12,8 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import deque
+import copy
+import types
 import unittest
 
+from google.cloud._helpers import UTC
+from google.cloud._helpers import _NOW
+from google.cloud._helpers import _datetime_to_rfc3339
+from google.cloud._helpers import _rfc3339_to_datetime
+from google.cloud.exceptions import NotFound
+
 
 class TestChanges(unittest.TestCase):
     PROJECT = "project"
@@ -29,20 +38,13 @@ class TestChanges(unittest.TestCase):
     def _make_one(self, *args, **kw):
         return self._get_target_class()(*args, **kw)
 
-    def _setUpConstants(self):
-        from google.cloud._helpers import UTC
-        from google.cloud._helpers import _NOW
-
-        self.WHEN = _NOW().replace(tzinfo=UTC)
-
-    def _make_resource(self):
-        from google.cloud._helpers import _datetime_to_rfc3339
-
-        when_str = _datetime_to_rfc3339(self.WHEN)
-        return {
+    @classmethod
+    def setUpClass(cls):
+        cls.WHEN = _NOW().replace(tzinfo=UTC)
+        cls._TEMPLATE = {
             "kind": "dns#change",
-            "id": self.CHANGES_NAME,
-            "startTime": when_str,
+            "id": cls.CHANGES_NAME,
+            "startTime": _datetime_to_rfc3339(cls.WHEN),
             "status": "done",
             "additions": [
                 {
@@ -61,32 +63,32 @@ class TestChanges(unittest.TestCase):
                 }
             ],
         }
+        cls._RESOURCE_RO = types.MappingProxyType(cls._TEMPLATE)
 
-    def _verifyResourceProperties(self, changes, resource, zone):
-        from google.cloud._helpers import _rfc3339_to_datetime
+    def _make_resource(self):
+        return self._RESOURCE_RO
+
+    def _make_resource_mutable(self):
+        return copy.deepcopy(self._TEMPLATE)
 
+    def _verifyResourceProperties(self, changes, resource, zone):
         self.assertEqual(changes.name, resource["id"])
         started = _rfc3339_to_datetime(resource["startTime"])
         self.assertEqual(changes.started, started)
         self.assertEqual(changes.status, resource["status"])
 
-        r_additions = resource.get("additions", ())
-        self.assertEqual(len(changes.additions), len(r_additions))
-        for found, expected in zip(changes.additions, r_additions):
-            self.assertEqual(found.name, expected["name"])
-            self.assertEqual(found.record_type, expected["type"])
-            self.assertEqual(found.ttl, int(expected["ttl"]))
-            self.assertEqual(found.rrdatas, expected["rrdatas"])
-            self.assertIs(found.zone, zone)
-
-        r_deletions = resource.get("deletions", ())
-        self.assertEqual(len(changes.deletions), len(r_deletions))
-        for found, expected in zip(changes.deletions, r_deletions):
-            self.assertEqual(found.name, expected["name"])
-            self.assertEqual(found.record_type, expected["type"])
-            self.assertEqual(found.ttl, int(expected["ttl"]))
-            self.assertEqual(found.rrdatas, expected["rrdatas"])
-            self.assertIs(found.zone, zone)
+        for found_sets, key in (
+            (changes.additions, "additions"),
+            (changes.deletions, "deletions"),
+        ):
+            expected = [
+                (r["name"], r["type"], int(r["ttl"]), r["rrdatas"])
+                for r in resource.get(key, ())
+            ]
+            found = [(f.name, f.record_type, f.ttl, f.rrdatas) for f in found_sets]
+            self.assertEqual(found, expected)
+            for record_set in found_sets:
+                self.assertIs(record_set.zone, zone)
 
     def test_ctor(self):
         zone = _Zone()
@@ -101,8 +103,7 @@ class TestChanges(unittest.TestCase):
         self.assertEqual(list(changes.deletions), [])
 
     def test_from_api_repr_missing_additions_deletions(self):
-        self._setUpConstants()
-        RESOURCE = self._make_resource()
+        RESOURCE = self._make_resource_mutable()
         del RESOURCE["additions"]
         del RESOURCE["deletions"]
         zone = _Zone()
@@ -113,7 +114,6 @@ class TestChanges(unittest.TestCase):
         self._verifyResourceProperties(changes, RESOURCE, zone)
 
     def test_from_api_repr(self):
-        self._setUpConstants()
         RESOURCE = self._make_resource()
         zone = _Zone()
         klass = self._get_target_class()
@@ -128,6 +128,24 @@ class TestChanges(unittest.TestCase):
         with self.assertRaises(ValueError):
             changes.name = 12345
 
+    def test_path(self):
+        PATH = "/projects/%s/managedZones/%s/changes/%s" % (
+            self.PROJECT,
+            self.ZONE_NAME,
+            self.CHANGES_NAME,
+        )
+        zone = _Zone()
+        changes = self._make_one(zone)
+        changes.name = self.CHANGES_NAME
+
+        self.assertEqual(changes.path, PATH)
+        zone.name = "other.example.com"
+        self.assertEqual(
+            changes.path,
+            "/projects/%s/managedZones/other.example.com/changes/%s"
+            % (self.PROJECT, self.CHANGES_NAME),
+        )
+
     def test_name_setter(self):
         zone = _Zone()
         changes = self._make_one(zone)
@@ -171,7 +189,6 @@ class TestChanges(unittest.TestCase):
         self.assertEqual(list(changes.deletions), [rrs])
 
     def test_create_wo_additions_or_deletions(self):
-        self._setUpConstants()
         RESOURCE = self._make_resource()
         conn = _Connection(RESOURCE)
         client = _Client(project=self.PROJECT, connection=conn)
@@ -186,7 +203,6 @@ class TestChanges(unittest.TestCase):
     def test_create_w_bound_client(self):
         from google.cloud.dns.resource_record_set import ResourceRecordSet
 
-        self._setUpConstants()
         RESOURCE = self._make_resource()
         PATH = "projects/%s/managedZones/%s/changes" % (self.PROJECT, self.ZONE_NAME)
         conn = _Connection(RESOURCE)
@@ -217,7 +233,6 @@ class TestChanges(unittest.TestCase):
     def test_create_w_alternate_client(self):
         from google.cloud.dns.resource_record_set import ResourceRecordSet
 
-        self._setUpConstants()
         RESOURCE = self._make_resource()
         PATH = "projects/%s/managedZones/%s/changes" % (self.PROJECT, self.ZONE_NAME)
         conn1 = _Connection()
@@ -254,7 +269,6 @@ class TestChanges(unittest.TestCase):
             self.ZONE_NAME,
             self.CHANGES_NAME,
         )
-        self._setUpConstants()
         conn = _Connection()
         client = _Client(project=self.PROJECT, connection=conn)
         zone = _Zone(client)
@@ -298,7 +312,6 @@ class TestChanges(unittest.TestCase):
             self.ZONE_NAME,
             self.CHANGES_NAME,
         )
-        self._setUpConstants()
         RESOURCE = self._make_resource()
         conn = _Connection(RESOURCE)
         client = _Client(project=self.PROJECT, connection=conn)
@@ -320,7 +333,6 @@ class TestChanges(unittest.TestCase):
             self.ZONE_NAME,
             self.CHANGES_NAME,
         )
-        self._setUpConstants()
         RESOURCE = self._make_resource()
         conn1 = _Connection()
         client1 = _Client(project=self.PROJECT, connection=conn1)
@@ -357,17 +369,13 @@ class _Client(object):
 
 class _Connection(object):
     def __init__(self, *responses):
-        self._responses = responses
+        self._responses = deque(responses)
         self._requested = []
 
     def api_request(self, **kw):
-        from google.cloud.exceptions import NotFound
-
         self._requested.append(kw)
 
         try:
-            response, self._responses = self._responses[0], self._responses[1:]
+            return self._responses.popleft()
         except IndexError:
             raise NotFound("miss")
-        else:
-            return response
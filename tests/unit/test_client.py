@@ -51,6 +51,46 @@ class TestClient(unittest.TestCase):
             client._connection.API_BASE_URL, client._connection.DEFAULT_API_ENDPOINT
         )
 
+    def test_ctor_wo_http_shares_authorized_session(self):
+        from google.auth.transport.requests import AuthorizedSession
+
+        creds = _make_credentials()
+        client = self._make_one(project=self.PROJECT, credentials=creds)
+        session = client._connection.http
+        self.assertIsInstance(session, AuthorizedSession)
+        self.assertIs(session.credentials, creds)
+        self.assertIs(client._http, session)
+        self.assertIs(client._connection.http, session)
+
+    def test_ctor_w_httpx_transport(self):
+        creds = _make_credentials()
+        patch = mock.patch("google.cloud.dns.client._HTTPXSession")
+        with patch as session_class:
+            client = self._make_one(
+                project=self.PROJECT, credentials=creds, transport="httpx"
+            )
+
+        session_class.assert_called_once_with(creds)
+        self.assertIs(client._http, session_class.return_value)
+        self.assertIs(client._connection.http, session_class.return_value)
+
+    def test_ctor_w_httpx_transport_and_http(self):
+        creds = _make_credentials()
+        http = object()
+        patch = mock.patch("google.cloud.dns.client._HTTPXSession")
+        with patch as session_class:
+            client = self._make_one(
+                project=self.PROJECT, credentials=creds, _http=http, transport="httpx"
+            )
+
+        session_class.assert_not_called()
+        self.assertIs(client._connection.http, http)
+
+    def test_ctor_w_invalid_transport(self):
+        creds = _make_credentials()
+        with self.assertRaises(ValueError):
+            self._make_one(project=self.PROJECT, credentials=creds, transport="grpc")
+
     def test_ctor_w_client_info(self):
         from google.api_core.client_info import ClientInfo
         from google.cloud.dns._http import Connection
@@ -149,6 +189,8 @@ class TestClient(unittest.TestCase):
         self.assertEqual(req["path"], "/%s" % PATH)
 
     def test_quotas_w_kind_key(self):
+        import copy
+
         PATH = "projects/%s" % (self.PROJECT,)
         MANAGED_ZONES = 1234
         RRS_PER_RRSET = 23
@@ -174,22 +216,91 @@ class TestClient(unittest.TestCase):
             }
         }
         CONVERTED = DATA["quota"]
-        WITH_KIND = {"quota": DATA["quota"].copy()}
+        WITH_KIND = copy.deepcopy(DATA)
         WITH_KIND["quota"]["kind"] = "dns#quota"
         WITH_KIND["quota"]["whitelistedKeySpecs"][0]["kind"] = "dns#dnsKeySpec"
+        RESPONSE = copy.deepcopy(WITH_KIND)
         creds = _make_credentials()
         client = self._make_one(self.PROJECT, creds)
-        conn = client._connection = _Connection(WITH_KIND)
+        conn = client._connection = _Connection(RESPONSE)
 
         quotas = client.quotas()
 
         self.assertEqual(quotas, CONVERTED)
+        self.assertEqual(RESPONSE, WITH_KIND)
 
         self.assertEqual(len(conn._requested), 1)
         req = conn._requested[0]
         self.assertEqual(req["method"], "GET")
         self.assertEqual(req["path"], "/%s" % PATH)
 
+    def test_paths_follow_project(self):
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        self.assertEqual(client._project_path, "/projects/%s" % (self.PROJECT,))
+        self.assertEqual(
+            client._zones_path, "/projects/%s/managedZones" % (self.PROJECT,)
+        )
+
+        client.project = "OTHER"
+
+        self.assertEqual(client._project_path, "/projects/OTHER")
+        self.assertEqual(client._zones_path, "/projects/OTHER/managedZones")
+
+    def test_quotas_cached(self):
+        DATA = {"quota": {"managedZones": 1234}}
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        conn = client._connection = _Connection(DATA)
+
+        first = client.quotas()
+        first.pop("managedZones")
+        second = client.quotas()
+
+        self.assertEqual(second, DATA["quota"])
+        self.assertEqual(len(conn._requested), 1)
+
+    def test_quotas_cache_expired(self):
+        DATA_1 = {"quota": {"managedZones": 1234}}
+        DATA_2 = {"quota": {"managedZones": 2345}}
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        conn = client._connection = _Connection(DATA_1, DATA_2)
+
+        client.quotas()
+        quotas = client.quotas(ttl=0)
+
+        self.assertEqual(quotas, DATA_2["quota"])
+        self.assertEqual(len(conn._requested), 2)
+
+    def test_quotas_cache_w_changed_project(self):
+        DATA_1 = {"quota": {"managedZones": 1234}}
+        DATA_2 = {"quota": {"managedZones": 2345}}
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        conn = client._connection = _Connection(DATA_1, DATA_2)
+
+        client.quotas()
+        client.project = "OTHER"
+        quotas = client.quotas()
+
+        self.assertEqual(quotas, DATA_2["quota"])
+        self.assertEqual(len(conn._requested), 2)
+        self.assertEqual(conn._requested[1]["path"], "/projects/OTHER")
+
+    def test_quotas_w_force_refresh(self):
+        DATA_1 = {"quota": {"managedZones": 1234}}
+        DATA_2 = {"quota": {"managedZones": 2345}}
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        conn = client._connection = _Connection(DATA_1, DATA_2)
+
+        client.quotas()
+        quotas = client.quotas(force_refresh=True)
+
+        self.assertEqual(quotas, DATA_2["quota"])
+        self.assertEqual(len(conn._requested), 2)
+
     def test_list_zones_defaults(self):
         from google.cloud.dns.zone import ManagedZone
 
@@ -290,6 +401,269 @@ class TestClient(unittest.TestCase):
         self.assertEqual(req["path"], "/%s" % PATH)
         self.assertEqual(req["query_params"], {"maxResults": 3, "pageToken": TOKEN})
 
+    def test_list_zones_w_page_size(self):
+        DATA = {
+            "managedZones": [
+                {"id": "123", "name": "zone_one", "dnsName": "one.example.com"}
+            ]
+        }
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        conn = client._connection = _Connection(DATA)
+
+        zones = list(client.list_zones(page_size=1))
+
+        self.assertEqual([zone.zone_id for zone in zones], ["123"])
+        self.assertEqual(len(conn._requested), 1)
+        self.assertEqual(conn._requested[0]["query_params"], {"maxResults": 1})
+
+    def test_list_zones_wo_page_size_omits_kwarg(self):
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+
+        patch = mock.patch("google.api_core.page_iterator.HTTPIterator")
+        with patch as iterator_class:
+            client.list_zones()
+
+        self.assertNotIn("page_size", iterator_class.call_args[1])
+
+    def test_list_zones_w_prefetch(self):
+        from google.cloud.dns.zone import ManagedZone
+
+        PATH = "projects/%s/managedZones" % (self.PROJECT,)
+        TOKEN = "TOKEN"
+        DATA_1 = {
+            "nextPageToken": TOKEN,
+            "managedZones": [
+                {"id": "123", "name": "zone_one", "dnsName": "one.example.com"},
+                {"id": "234", "name": "zone_two", "dnsName": "two.example.com"},
+            ],
+        }
+        DATA_2 = {
+            "managedZones": [
+                {"id": "345", "name": "zone_three", "dnsName": "three.example.com"}
+            ]
+        }
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        conn = client._connection = _Connection(DATA_1, DATA_2)
+
+        iterator = client.list_zones(max_results=5, prefetch=True)
+        zones = list(iterator)
+
+        ALL_ZONES = DATA_1["managedZones"] + DATA_2["managedZones"]
+        self.assertEqual(len(zones), len(ALL_ZONES))
+        for found, expected in zip(zones, ALL_ZONES):
+            self.assertIsInstance(found, ManagedZone)
+            self.assertEqual(found.zone_id, expected["id"])
+            self.assertEqual(found.name, expected["name"])
+        self.assertIsNone(iterator._executor)
+
+        self.assertEqual(len(conn._requested), 2)
+        for req in conn._requested:
+            self.assertEqual(req["method"], "GET")
+            self.assertEqual(req["path"], "/%s" % PATH)
+        self.assertEqual(conn._requested[0]["query_params"], {"maxResults": 5})
+        self.assertEqual(
+            conn._requested[1]["query_params"], {"maxResults": 3, "pageToken": TOKEN}
+        )
+
+    def test_list_zones_w_prefetch_stops_at_max_results(self):
+        DATA = {
+            "nextPageToken": "TOKEN",
+            "managedZones": [
+                {"id": "123", "name": "zone_one", "dnsName": "one.example.com"},
+                {"id": "234", "name": "zone_two", "dnsName": "two.example.com"},
+            ],
+        }
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        conn = client._connection = _Connection(DATA)
+
+        iterator = client.list_zones(max_results=2, prefetch=True)
+        zones = list(iterator)
+
+        self.assertEqual(len(zones), 2)
+        self.assertEqual(len(conn._requested), 1)
+        self.assertIsNone(iterator._executor)
+
+    def test_list_zones_w_prefetch_wo_max_results(self):
+        DATA_1 = {
+            "nextPageToken": "TOKEN_1",
+            "managedZones": [
+                {"id": "123", "name": "zone_one", "dnsName": "one.example.com"}
+            ],
+        }
+        DATA_2 = {
+            "nextPageToken": "TOKEN_2",
+            "managedZones": [
+                {"id": "234", "name": "zone_two", "dnsName": "two.example.com"}
+            ],
+        }
+        DATA_3 = {
+            "managedZones": [
+                {"id": "345", "name": "zone_three", "dnsName": "three.example.com"}
+            ]
+        }
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        conn = client._connection = _Connection(DATA_1, DATA_2, DATA_3)
+
+        iterator = client.list_zones(prefetch=True)
+        zones = list(iterator)
+
+        self.assertEqual([zone.zone_id for zone in zones], ["123", "234", "345"])
+        self.assertEqual(
+            [req["query_params"] for req in conn._requested],
+            [{}, {"pageToken": "TOKEN_1"}, {"pageToken": "TOKEN_2"}],
+        )
+        self.assertIsNone(iterator._executor)
+
+    def test_list_zones_w_prefetch_failure(self):
+        from google.cloud.exceptions import ServiceUnavailable
+
+        DATA_1 = {
+            "nextPageToken": "TOKEN",
+            "managedZones": [
+                {"id": "123", "name": "zone_one", "dnsName": "one.example.com"}
+            ],
+        }
+        DATA_2 = {
+            "managedZones": [
+                {"id": "234", "name": "zone_two", "dnsName": "two.example.com"}
+            ]
+        }
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        conn = client._connection = _Connection(
+            DATA_1, ServiceUnavailable("unavailable"), DATA_2
+        )
+
+        iterator = client.list_zones(prefetch=True)
+        pages = iterator.pages
+        first = list(next(pages))
+
+        with self.assertRaises(ServiceUnavailable):
+            next(pages)
+
+        self.assertIsNone(iterator._pending)
+        self.assertIsNone(iterator._executor)
+
+        second = list(iterator._next_page())
+
+        self.assertEqual([zone.zone_id for zone in first], ["123"])
+        self.assertEqual([zone.zone_id for zone in second], ["234"])
+        self.assertEqual(
+            [req["query_params"] for req in conn._requested],
+            [{}, {"pageToken": "TOKEN"}, {"pageToken": "TOKEN"}],
+        )
+
+    def test_prefetching_iterator_wo_page_size_attribute(self):
+        DATA_1 = {
+            "nextPageToken": "TOKEN",
+            "managedZones": [
+                {"id": "123", "name": "zone_one", "dnsName": "one.example.com"}
+            ],
+        }
+        DATA_2 = {
+            "managedZones": [
+                {"id": "234", "name": "zone_two", "dnsName": "two.example.com"}
+            ]
+        }
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        conn = client._connection = _Connection(DATA_1, DATA_2)
+
+        iterator = client.list_zones(max_results=5, prefetch=True)
+
+        # Emulate google-api-core < 1.31, whose HTTPIterator has no page size.
+        def _get_query_params():
+            result = {}
+            if iterator.next_page_token is not None:
+                result["pageToken"] = iterator.next_page_token
+            result["maxResults"] = iterator.max_results - iterator.num_results
+            return result
+
+        del iterator._page_size
+        iterator._get_query_params = _get_query_params
+        zones = list(iterator)
+
+        self.assertEqual([zone.zone_id for zone in zones], ["123", "234"])
+        self.assertEqual(
+            [req["query_params"] for req in conn._requested],
+            [{"maxResults": 5}, {"maxResults": 4, "pageToken": "TOKEN"}],
+        )
+
+    def test_prefetching_iterator_w_page_size(self):
+        from google.cloud.dns.client import _PrefetchingHTTPIterator
+        from google.cloud.dns.client import _item_to_zone
+
+        DATA_1 = {
+            "nextPageToken": "TOKEN",
+            "managedZones": [
+                {"id": "123", "name": "zone_one", "dnsName": "one.example.com"}
+            ],
+        }
+        DATA_2 = {
+            "managedZones": [
+                {"id": "234", "name": "zone_two", "dnsName": "two.example.com"}
+            ]
+        }
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        conn = _Connection(DATA_1, DATA_2)
+
+        iterator = _PrefetchingHTTPIterator(
+            client=client,
+            api_request=conn.api_request,
+            path="/path",
+            item_to_value=_item_to_zone,
+            items_key="managedZones",
+            page_size=1,
+            max_results=5,
+        )
+        zones = list(iterator)
+
+        self.assertEqual([zone.zone_id for zone in zones], ["123", "234"])
+        self.assertEqual(
+            [req["query_params"] for req in conn._requested],
+            [{"maxResults": 1}, {"maxResults": 1, "pageToken": "TOKEN"}],
+        )
+
+    def test_iter_zones(self):
+        from google.cloud.dns.zone import ManagedZone
+
+        PATH = "projects/%s/managedZones" % (self.PROJECT,)
+        TOKEN = "TOKEN"
+        DATA_1 = {
+            "nextPageToken": TOKEN,
+            "managedZones": [
+                {"id": "123", "name": "zone_one", "dnsName": "one.example.com"},
+                {"id": "234", "name": "zone_two", "dnsName": "two.example.com"},
+            ],
+        }
+        DATA_2 = {}
+        creds = _make_credentials()
+        client = self._make_one(self.PROJECT, creds)
+        conn = client._connection = _Connection(DATA_1, DATA_2)
+
+        zones = list(client.iter_zones())
+
+        self.assertEqual(len(zones), len(DATA_1["managedZones"]))
+        for found, expected in zip(zones, DATA_1["managedZones"]):
+            self.assertIsInstance(found, ManagedZone)
+            self.assertEqual(found.zone_id, expected["id"])
+            self.assertEqual(found.name, expected["name"])
+            self.assertEqual(found.dns_name, expected["dnsName"])
+            self.assertIs(found._client, client)
+
+        self.assertEqual(len(conn._requested), 2)
+        for req in conn._requested:
+            self.assertEqual(req["method"], "GET")
+            self.assertEqual(req["path"], "/%s" % PATH)
+        self.assertEqual(conn._requested[0]["query_params"], {})
+        self.assertEqual(conn._requested[1]["query_params"], {"pageToken": TOKEN})
+
     def test_zone_explicit(self):
         from google.cloud.dns.zone import ManagedZone
 
@@ -338,4 +712,6 @@ class _Connection(object):
     def api_request(self, **kw):
         self._requested.append(kw)
         response, self._responses = self._responses[0], self._responses[1:]
+        if isinstance(response, Exception):
+            raise response
         return response
@@ -122,6 +122,19 @@ class TestManagedZone(unittest.TestCase):
         self.assertIsNone(zone.created)
         self.assertEqual(zone.description, self.DNS_NAME)
 
+    def test_ctor_uses_slots(self):
+        import weakref
+
+        client = _Client(self.PROJECT)
+        zone = self._make_one(self.ZONE_NAME, self.DNS_NAME, client)
+        with self.assertRaises(AttributeError):
+            getattr(zone, "__dict__")
+
+        with self.assertRaises(AttributeError):
+            zone.nonesuch = "value"
+
+        self.assertIs(weakref.ref(zone)(), zone)
+
     def test_ctor_explicit(self):
         DESCRIPTION = "DESCRIPTION"
         client = _Client(self.PROJECT)